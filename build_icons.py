@@ -0,0 +1,23 @@
+"""Pre-resize the player icons into icons/24 so the app can load them without PIL."""
+import os
+
+from PIL import Image
+
+SIZE = (24, 24)
+
+
+def main():
+    icons_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "icons")
+    out_path = os.path.join(icons_path, "24")
+    os.makedirs(out_path, exist_ok=True)
+    for name in sorted(os.listdir(icons_path)):
+        if not name.lower().endswith(".png"):
+            continue
+        src = os.path.join(icons_path, name)
+        dst = os.path.join(out_path, name)
+        Image.open(src).resize(SIZE, Image.LANCZOS).save(dst)
+        print(f"{src} -> {dst}")
+
+
+if __name__ == "__main__":
+    main()
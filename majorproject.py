@@ -1,31 +1,98 @@
+import functools
 import os
+import queue
+import stat
 import sys
+import threading
 import time
 import tkinter as tk
+from concurrent.futures import ThreadPoolExecutor
 from tkinter import ttk, filedialog, messagebox
 
-# Optional libs (graceful fallback)
+# Optional libs (graceful fallback), imported on first use to keep startup fast
 PIL_OK = True
-DND_OK = True
-try:
-    from PIL import Image, ImageTk
-except Exception:
-    PIL_OK = False
-try:
-    from tkinterdnd2 import DND_FILES, TkinterDnD
-except Exception:
-    DND_OK = False
+DND_OK = False
+Image = ImageTk = None
+DND_FILES = TkinterDnD = None
+
+def _import_pil():
+    global Image, ImageTk
+    if Image is None:
+        from PIL import Image, ImageTk
+
+def _import_dnd():
+    global DND_OK, DND_FILES, TkinterDnD
+    if os.environ.get("MINIVLC_NO_DND") == "1":
+        return
+    try:
+        from tkinterdnd2 import DND_FILES, TkinterDnD
+        DND_OK = True
+    except Exception:
+        DND_OK = False
 
 import vlc
 
 # ---------- helpers ----------
+EXTS = frozenset({".mp4", ".mkv", ".avi", ".mov", ".mp3", ".wav", ".flac", ".m4a", ".aac", ".ogg"})
+
+def is_media(name: str) -> bool:
+    return os.path.splitext(name)[1].lower() in EXTS
+
+def scan_media(folder: str) -> list:
+    # top-down walk like os.walk, but DirEntry avoids the extra stat/join per file
+    found = []
+    stack = [folder]
+    while stack:
+        subdirs = []
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                    elif entry.is_file() and is_media(entry.name):
+                        found.append(entry.path)
+        except OSError:
+            continue
+        stack.extend(reversed(subdirs))
+    return found
+
+def collect_media(paths) -> list:
+    found = []
+    for p in paths:
+        # one stat per dropped item instead of isdir + isfile
+        try:
+            mode = os.stat(p).st_mode
+        except OSError:
+            continue
+        if stat.S_ISDIR(mode):
+            found.extend(scan_media(p))
+        elif stat.S_ISREG(mode) and is_media(p):
+            found.append(p)
+    return found
+
+_STATE_NAMES = {
+    vlc.State.Playing: "Playing",
+    vlc.State.Paused: "Paused",
+    vlc.State.Stopped: "Stopped",
+}
+
+_IDLE_STATES = frozenset({vlc.State.Paused, vlc.State.Stopped, vlc.State.NothingSpecial})
+
+ICON_NAMES = ("play", "pause", "stop", "prev", "next", "fullscreen", "mute", "unmute")
+
+@functools.lru_cache(maxsize=8192)
+def _fmt_seconds(s: int) -> str:
+    return f"{s // 60:02}:{s % 60:02}"
+
 def fmt_time(ms: int) -> str:
     if ms is None or ms < 0:
         return "00:00"
-    s = ms // 1000
-    return f"{s // 60:02}:{s % 60:02}"
+    return _fmt_seconds(int(ms) // 1000)
 
 class MiniVLC:
+    # icons are shared by every window on the same Tk interpreter
+    _icons = {}
+
     def __init__(self, root):
         self.root = root
         self.root.title("🎬 Mini VLC")
@@ -35,12 +102,32 @@ class MiniVLC:
 
         self.vlc_instance = vlc.Instance()
         self.player = self.vlc_instance.media_player_new()
+        # libvlc callbacks only enqueue; _poll drains this on the Tk thread
+        self._vlc_events = queue.Queue()
+        # attached once: the player's event manager outlives each media
+        events = self.player.event_manager()
+        events.event_attach(vlc.EventType.MediaPlayerLengthChanged, self._on_length_changed)
+        events.event_attach(vlc.EventType.MediaPlayerEndReached, lambda e: self._vlc_events.put("end"))
 
         self.playlist = []
+        self._playlist_set = set()
+        self._scan_queue = queue.Queue()
+        self._scan_thread = None
+        self._scan_lock = threading.Lock()
+        self._scans_lost = 0
+        self._status_before_scan = "Ready"
+        self._scans_in_flight = 0
         self.current_index = -1
+        self._last_selected_index = None
         self.length_ms = 0
         self.poll_job = None
+        self._poll_running = False
+        self._last_cur_s = -1
+        self._last_seek_set_ms = 0
         self.user_dragging_seek = False
+        self._pending_label_updates = {}
+        self._last_label_vals = {"cur": "00:00", "tot": "00:00", "status": "Ready"}
+        self._label_flush_job = None
         self.fullscreen = False
         self.muted = False
         self.saved_volume = 80
@@ -78,26 +165,51 @@ class MiniVLC:
 
     def _load_images(self):
         global PIL_OK
-        if not PIL_OK:
-            return
-        
-        size = (24, 24)
-        try:
-            # Create a path for the icons folder
-            base_path = getattr(sys, '_MEIPASS', os.path.dirname(os.path.abspath(__file__)))
-            icons_path = os.path.join(base_path, "icons")
-            
-            self.play_img = ImageTk.PhotoImage(Image.open(os.path.join(icons_path, "play.png")).resize(size, Image.LANCZOS))
-            self.pause_img = ImageTk.PhotoImage(Image.open(os.path.join(icons_path, "pause.png")).resize(size, Image.LANCZOS))
-            self.stop_img = ImageTk.PhotoImage(Image.open(os.path.join(icons_path, "stop.png")).resize(size, Image.LANCZOS))
-            self.prev_img = ImageTk.PhotoImage(Image.open(os.path.join(icons_path, "prev.png")).resize(size, Image.LANCZOS))
-            self.next_img = ImageTk.PhotoImage(Image.open(os.path.join(icons_path, "next.png")).resize(size, Image.LANCZOS))
-            self.fullscreen_img = ImageTk.PhotoImage(Image.open(os.path.join(icons_path, "fullscreen.png")).resize(size, Image.LANCZOS))
-            self.mute_img = ImageTk.PhotoImage(Image.open(os.path.join(icons_path, "mute.png")).resize(size, Image.LANCZOS))
-            self.unmute_img = ImageTk.PhotoImage(Image.open(os.path.join(icons_path, "unmute.png")).resize(size, Image.LANCZOS))
-        except Exception as e:
-            print(f"Error loading images: {e}. Falling back to text.")
-            PIL_OK = False
+        # PhotoImages belong to one Tcl interpreter, so share them per root
+        icons = type(self)._icons.get(self.root.tk)
+        if icons is None:
+            size = (24, 24)
+            try:
+                # Create a path for the icons folder
+                base_path = getattr(sys, '_MEIPASS', os.path.dirname(os.path.abspath(__file__)))
+                icons_path = os.path.join(base_path, "icons")
+                # pre-resized copies from build_icons.py load without PIL
+                cache_path = os.path.join(icons_path, "24")
+
+                icons = {}
+                missing = []
+                for name in ICON_NAMES:
+                    cached = os.path.join(cache_path, name + ".png")
+                    if os.path.isfile(cached):
+                        icons[name] = tk.PhotoImage(master=self.root, file=cached)
+                    else:
+                        missing.append(name)
+
+                if missing:
+                    _import_pil()
+
+                    def resize(name):
+                        return Image.open(os.path.join(icons_path, name + ".png")).resize(size, Image.LANCZOS)
+
+                    # PIL releases the GIL while decoding; PhotoImages must still be built on the Tk thread
+                    with ThreadPoolExecutor(max_workers=4) as ex:
+                        for name, img in zip(missing, ex.map(resize, missing)):
+                            icons[name] = ImageTk.PhotoImage(img, master=self.root)
+            except Exception as e:
+                print(f"Error loading images: {e}. Falling back to text.")
+                PIL_OK = False
+                return
+            type(self)._icons[self.root.tk] = icons
+            # don't keep a destroyed interpreter and its images alive
+            self.root.bind("<Destroy>", self._on_root_destroy, add="+")
+
+        PIL_OK = True
+        for name, img in icons.items():
+            setattr(self, f"{name}_img", img)
+
+    def _on_root_destroy(self, event):
+        if event.widget is self.root:
+            type(self)._icons.pop(self.root.tk, None)
 
     def _build_ui(self):
         top = ttk.Frame(self.root, style="Bar.TFrame")
@@ -125,10 +237,10 @@ class MiniVLC:
         self.lbl_cur.pack(side="left")
         self.lbl_tot.pack(side="right")
 
-        self.seek = ttk.Scale(ctrl_card, from_=0, to=100, orient="horizontal",
-                              command=self._on_seek_drag)
+        self.seek = ttk.Scale(ctrl_card, from_=0, to=100, orient="horizontal")
         self.seek.pack(fill="x", padx=12, pady=(4, 10))
         self.seek.bind("<Button-1>", lambda e: self._set_drag(True))
+        self.seek.bind("<B1-Motion>", self._on_seek_drag)
         self.seek.bind("<ButtonRelease-1>", lambda e: self._set_drag(False, commit=True))
 
         row = ttk.Frame(ctrl_card, style="Card.TFrame")
@@ -185,11 +297,12 @@ class MiniVLC:
                                   selectbackground="#1DB954", activestyle="none",
                                   highlightthickness=0, bd=0, font=("Segoe UI", 10))
         self.listbox.pack(side="left", fill="both", expand=True)
-        sb = ttk.Scrollbar(lstwrap, orient="vertical", command=self.listbox.yview)
-        sb.pack(side="right", fill="y")
-        self.listbox.config(yscrollcommand=sb.set)
+        self.playlist_sb = ttk.Scrollbar(lstwrap, orient="vertical", command=self.listbox.yview)
+        self.playlist_sb.pack(side="right", fill="y")
+        self.listbox.config(yscrollcommand=self.playlist_sb.set)
         self.listbox.bind("<Double-Button-1>", lambda e: self.play_selected())
         self.listbox.bind("<Return>", lambda e: self.play_selected())
+        self.listbox.bind("<<ListboxSelect>>", self._on_listbox_select)
 
         pbtns = ttk.Frame(right, style="Card.TFrame")
         pbtns.pack(fill="x", padx=10, pady=(0, 10))
@@ -239,13 +352,8 @@ class MiniVLC:
             filetypes=[("Media files", "*.*")])
         if not files:
             return
-        added = 0
-        for f in files:
-            if f not in self.playlist:
-                self.playlist.append(f)
-                self.listbox.insert(tk.END, os.path.basename(f))
-                added += 1
-        self.status_var.set(f"Added {added} file(s).")
+        added = self._add_to_playlist(files)
+        self._set_label("status", f"Added {added} file(s).")
         if self.current_index == -1 and self.playlist:
             self.current_index = 0
 
@@ -253,50 +361,153 @@ class MiniVLC:
         folder = filedialog.askdirectory(title="Open Folder")
         if not folder:
             return
-        exts = (".mp4", ".mkv", ".avi", ".mov", ".mp3", ".wav", ".flac", ".m4a", ".aac", ".ogg")
-        items = []
-        for root_, _, files in os.walk(folder):
-            for name in files:
-                if name.lower().endswith(exts):
-                    items.append(os.path.join(root_, name))
+        self._scan_async([folder], "folder")
+        self._set_label("status", "Scanning folder...")
+
+    def _scan_async(self, paths, source):
+        self._reap_lost_scans()
+        # Tk-thread bookkeeping: remember the status to restore when the
+        # first of a batch of overlapping scans starts
+        if self._scans_in_flight == 0:
+            self._status_before_scan = self._status_text()
+        self._scans_in_flight += 1
+        # one worker drains the queue so concurrent scans never interleave;
+        # the lock pairs this check with the worker's exit
+        with self._scan_lock:
+            self._scan_queue.put((paths, source))
+            if self._scan_thread is None:
+                self._scan_thread = threading.Thread(target=self._scan_worker, daemon=True)
+                self._scan_thread.start()
+
+    def _scan_worker(self):
+        while True:
+            with self._scan_lock:
+                try:
+                    paths, source = self._scan_queue.get_nowait()
+                except queue.Empty:
+                    self._scan_thread = None
+                    return
+            try:
+                items = collect_media(paths)
+            except Exception:
+                items = []
+            # widgets may only be touched from the Tk thread
+            try:
+                self.root.after(0, lambda items=items, source=source: self._ingest_scan_results(items, source))
+            except Exception:
+                # Tk is gone or not looping yet; the Tk side settles these later
+                with self._scan_lock:
+                    self._scans_lost += 1
+
+    def _reap_lost_scans(self):
+        with self._scan_lock:
+            lost, self._scans_lost = self._scans_lost, 0
+        if lost:
+            self._scans_in_flight = max(0, self._scans_in_flight - lost)
+            self._restore_status_if_idle()
+
+    def _status_text(self):
+        return self._pending_label_updates.get("status", self._last_label_vals.get("status", "Ready"))
+
+    def _restore_status_if_idle(self):
+        # only undo our own "Scanning..." message, never a newer status
+        if self._scans_in_flight == 0 and self._status_text() == "Scanning folder...":
+            self._set_label("status", self._status_before_scan)
+
+    def _ingest_scan_results(self, items, source):
+        self._scans_in_flight -= 1
         if not items:
-            messagebox.showinfo("No media", "No supported media found in this folder.")
+            self._restore_status_if_idle()
+            if source == "folder":
+                messagebox.showinfo("No media", "No supported media found in this folder.")
             return
-        added = 0
-        for p in items:
-            if p not in self.playlist:
-                self.playlist.append(p)
-                self.listbox.insert(tk.END, os.path.basename(p))
-                added += 1
-        self.status_var.set(f"Added {added} file(s) from folder.")
+        added = self._add_to_playlist(items)
+        if source == "folder":
+            self._set_label("status", f"Added {added} file(s) from folder.")
+        else:
+            self._set_label("status", f"Added {added} item(s) by drag & drop.")
         if self.current_index == -1 and self.playlist:
             self.current_index = 0
 
+    def _add_to_playlist(self, paths):
+        batch = []
+        for p in paths:
+            if p not in self._playlist_set:
+                self._playlist_set.add(p)
+                self.playlist.append(p)
+                batch.append(os.path.basename(p))
+        if batch:
+            self._detach_scrollbar()
+            self.listbox.insert(tk.END, *batch)
+            self._reattach_scrollbar()
+        return len(batch)
+
+    def _detach_scrollbar(self):
+        # keep the scrollbar from redrawing on every row during bulk edits
+        self.listbox.config(yscrollcommand="")
+
+    def _reattach_scrollbar(self):
+        self.listbox.config(yscrollcommand=self.playlist_sb.set)
+        self.playlist_sb.set(*self.listbox.yview())
+
     def remove_selected(self):
         sel = list(self.listbox.curselection())
         if not sel:
             return
-        for idx in reversed(sel):
-            real = idx
-            if real == self.current_index:
-                self.stop()
-                self.current_index = -1
-            del self.playlist[real]
-            self.listbox.delete(idx)
-        
+        sel_set = set(sel)
+        if self.current_index in sel_set:
+            self.stop()
+            self.current_index = -1
+
+        # collapse the selection into contiguous runs: one Tcl delete per run
+        ranges = []
+        start = prev = sel[0]
+        for idx in sel[1:]:
+            if idx != prev + 1:
+                ranges.append((start, prev))
+                start = idx
+            prev = idx
+        ranges.append((start, prev))
+        self._last_selected_index = None
+        self._detach_scrollbar()
+        for start, end in reversed(ranges):
+            self.listbox.delete(start, end)
+        self._reattach_scrollbar()
+
+        for idx in sel:
+            self._playlist_set.discard(self.playlist[idx])
+        self.playlist = [p for i, p in enumerate(self.playlist) if i not in sel_set]
+
         if self.playlist:
             self.current_index = min(self.current_index if self.current_index != -1 else 0,
                                      len(self.playlist) - 1)
         else:
             self.current_index = -1
-        self.status_var.set("Removed selection.")
+        self._set_label("status", "Removed selection.")
 
     def clear_playlist(self):
         self.stop()
         self.playlist.clear()
+        self._playlist_set.clear()
+        self._detach_scrollbar()
+        self.listbox.selection_clear(0, tk.END)
         self.listbox.delete(0, tk.END)
+        self._last_selected_index = None
+        self._reattach_scrollbar()
         self.current_index = -1
-        self.status_var.set("Playlist cleared.")
+        self._set_label("status", "Playlist cleared.")
+
+    def _on_listbox_select(self, _event=None):
+        sel = self.listbox.curselection()
+        self._last_selected_index = sel[0] if sel else None
+
+    def _select_current(self):
+        # clear only the row we know is selected rather than the whole list
+        if self._last_selected_index is not None:
+            self.listbox.selection_clear(self._last_selected_index)
+        self.listbox.selection_set(self.current_index)
+        self.listbox.see(self.current_index)
+        self._last_selected_index = self.current_index
 
     def play_selected(self):
         try:
@@ -314,27 +525,33 @@ class MiniVLC:
         try:
             media = self.vlc_instance.media_new(path)
             self.player.set_media(media)
+            self._drain_vlc_events()
             self.player.play()
             self.is_playing = True
             if PIL_OK:
                 self.play_btn.config(image=self.pause_img)
             else:
                 self.play_btn.config(text="⏸")
-            self.status_var.set(f"Playing: {os.path.basename(path)}")
-            self.root.after(300, self._update_total_length)
+            self._set_label("status", f"Playing: {os.path.basename(path)}")
             self._start_poll()
         except Exception as e:
             messagebox.showerror("Playback error", str(e))
 
     def play_pause(self):
-        if self.player.get_state() in (vlc.State.NothingSpecial, vlc.State.Stopped) and self.playlist:
+        state = self.player.get_state()
+        if state in (vlc.State.NothingSpecial, vlc.State.Stopped) and self.playlist:
             if self.current_index == -1:
                 self.current_index = 0
             self._load_and_play_current()
             return
         
         self.player.pause()
-        self.is_playing = self.player.get_state() == vlc.State.Playing
+        # pause() toggles and settles asynchronously, so derive the new state
+        # from the one read above instead of querying libvlc again
+        self.is_playing = state == vlc.State.Paused
+        if state == vlc.State.Paused:
+            # resuming: get back to fast ticks right away
+            self._start_poll()
         
         if PIL_OK:
             if self.is_playing:
@@ -356,71 +573,95 @@ class MiniVLC:
             pass
         self._stop_poll()
         self.seek.set(0)
-        self.lbl_cur.config(text="00:00")
-        self.lbl_tot.config(text="00:00")
+        self._last_seek_set_ms = 0
+        self._set_label("cur", "00:00")
+        self._set_label("tot", "00:00")
+        self._last_cur_s = -1
         self.length_ms = 0
         self.is_playing = False
         if PIL_OK:
             self.play_btn.config(image=self.play_img)
         else:
             self.play_btn.config(text="▶/⏸")
-        self.status_var.set("Stopped")
+        self._set_label("status", "Stopped")
 
     def next(self):
         if not self.playlist:
             return
         self.current_index = (self.current_index + 1) % len(self.playlist)
         self._load_and_play_current()
-        self.listbox.selection_clear(0, tk.END)
-        self.listbox.selection_set(self.current_index)
-        self.listbox.see(self.current_index)
+        self._select_current()
 
     def prev(self):
         if not self.playlist:
             return
         self.current_index = (self.current_index - 1) % len(self.playlist)
         self._load_and_play_current()
-        self.listbox.selection_clear(0, tk.END)
-        self.listbox.selection_set(self.current_index)
-        self.listbox.see(self.current_index)
+        self._select_current()
 
     # ---------- time/seek ----------
+    def _on_length_changed(self, _event):
+        # fired on libvlc's input thread: no Tcl calls here, the main thread
+        # may be blocked in stop()/set_media() waiting for this very thread
+        self._vlc_events.put("length")
+
+    def _drain_vlc_events(self):
+        events = set()
+        while True:
+            try:
+                events.add(self._vlc_events.get_nowait())
+            except queue.Empty:
+                return events
+
     def _update_total_length(self):
         ms = self.player.get_length()
         if ms and ms > 0:
             self.length_ms = ms
             self.seek.configure(to=ms)
-            self.lbl_tot.config(text=fmt_time(ms))
-        else:
-            self.root.after(300, self._update_total_length)
+            self._set_label("tot", fmt_time(ms))
 
     def _start_poll(self):
-        self._stop_poll()
+        self._poll_running = True
+        # replace any slow tick left over from a pause/stop with a fast one
+        if self.poll_job is not None:
+            self.root.after_cancel(self.poll_job)
         self.poll_job = self.root.after(250, self._poll)
 
     def _stop_poll(self):
-        if self.poll_job:
-            self.root.after_cancel(self.poll_job)
-            self.poll_job = None
+        self._poll_running = False
 
     def _poll(self):
-        state = self.player.get_state()
-        if state == vlc.State.Ended:
+        if not self._poll_running:
+            self.poll_job = None
+            return
+        events = self._drain_vlc_events()
+        if "length" in events:
+            self._update_total_length()
+        if "end" in events:
+            # next() restarts polling for the new media
             self.next()
             return
+        state = self.player.get_state()
         if not self.user_dragging_seek:
             cur = self.player.get_time()
             if cur is None:
                 cur = 0
-            self.seek.set(cur)
-            self.lbl_cur.config(text=fmt_time(cur))
-            if self.length_ms <= 0:
-                self._update_total_length()
-        self.poll_job = self.root.after(250, self._poll)
-
-    def _on_seek_drag(self, _val):
+            # only touch the widgets when the value visibly changes
+            cur_s = max(cur, 0) // 1000
+            if cur_s != self._last_cur_s:
+                self._last_cur_s = cur_s
+                self._set_label("cur", fmt_time(cur))
+            if abs(cur - self._last_seek_set_ms) >= 500:
+                self._last_seek_set_ms = cur
+                self.seek.set(cur)
+        # poll fast while playing (or opening), slow down when paused/stopped
+        delay = 1000 if state in _IDLE_STATES else 250
+        self.poll_job = self.root.after(delay, self._poll)
+
+    def _on_seek_drag(self, _event=None):
+        # _set_label already coalesces redraws to one per idle turn
         if self.user_dragging_seek:
-            self.lbl_cur.config(text=fmt_time(int(float(self.seek.get()))))
+            self._set_label("cur", fmt_time(int(float(self.seek.get()))))
 
     def _set_drag(self, dragging: bool, commit: bool = False):
         self.user_dragging_seek = dragging
@@ -428,6 +669,9 @@ class MiniVLC:
             try:
                 t = int(float(self.seek.get()))
                 self.player.set_time(t)
+                self._set_label("cur", fmt_time(t))
+                self._last_cur_s = t // 1000
+                self._last_seek_set_ms = t
             except Exception:
                 pass
 
@@ -438,7 +682,9 @@ class MiniVLC:
         new_ms = max(0, min(self.length_ms - 500, cur + seconds * 1000))
         self.player.set_time(new_ms)
         self.seek.set(new_ms)
-        self.lbl_cur.config(text=fmt_time(new_ms))
+        self._last_seek_set_ms = new_ms
+        self._set_label("cur", fmt_time(new_ms))
+        self._last_cur_s = new_ms // 1000
 
     # ---------- volume ----------
     def _set_volume(self, val):
@@ -484,59 +730,41 @@ class MiniVLC:
     # ---------- status ----------
     def _update_status_from_state(self):
         st = self.player.get_state()
-        name = {
-            vlc.State.Playing: "Playing",
-            vlc.State.Paused: "Paused",
-            vlc.State.Stopped: "Stopped",
-        }.get(st, str(st))
-        self.status_var.set(name)
+        name = _STATE_NAMES.get(st, str(st))
+        self._set_label("status", name)
+
+    # ---------- label batching ----------
+    def _set_label(self, key, text):
+        self._pending_label_updates[key] = text
+        self._schedule_flush()
+
+    def _schedule_flush(self):
+        if self._label_flush_job is None:
+            self._label_flush_job = self.root.after_idle(self._flush_labels)
+
+    def _flush_labels(self):
+        self._label_flush_job = None
+        pending, self._pending_label_updates = self._pending_label_updates, {}
+        for key, text in pending.items():
+            if self._last_label_vals.get(key) == text:
+                continue
+            self._last_label_vals[key] = text
+            if key == "cur":
+                self.lbl_cur.config(text=text)
+            elif key == "tot":
+                self.lbl_tot.config(text=text)
+            elif key == "status":
+                self.status_var.set(text)
 
     # ---------- drag & drop ----------
     def _on_drop(self, event):
-        raw = event.data
-        items = []
-        cur = ""
-        in_brace = False
-        for ch in raw:
-            if ch == "{":
-                in_brace = True
-                cur = ""
-            elif ch == "}":
-                in_brace = False
-                items.append(cur)
-                cur = ""
-            elif ch == " " and not in_brace:
-                if cur:
-                    items.append(cur)
-                    cur = ""
-            else:
-                cur += ch
-        if cur:
-            items.append(cur)
-        
-        exts = (".mp4", ".mkv", ".avi", ".mov", ".mp3", ".wav", ".flac", ".m4a", ".aac", ".ogg")
-        to_add = []
-        for p in items:
-            if os.path.isdir(p):
-                for r, _, fs in os.walk(p):
-                    for nm in fs:
-                        if nm.lower().endswith(exts):
-                            to_add.append(os.path.join(r, nm))
-            elif os.path.isfile(p) and p.lower().endswith(exts):
-                to_add.append(p)
-        if to_add:
-            added = 0
-            for f in to_add:
-                if f not in self.playlist:
-                    self.playlist.append(f)
-                    self.listbox.insert(tk.END, os.path.basename(f))
-                    added += 1
-            self.status_var.set(f"Added {added} item(s) by drag & drop.")
-            if self.current_index == -1:
-                self.current_index = 0
+        # Tcl list parsing handles {brace quoted} paths natively
+        items = self.root.tk.splitlist(event.data)
+        self._scan_async(items, "drop")
 
 # ---------- run ----------
 def main():
+    _import_dnd()
     if DND_OK:
         root = TkinterDnD.Tk()
     else: